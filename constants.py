@@ -5,7 +5,7 @@ import sys
 import random
 import logging
 from pathlib import Path
-from copy import deepcopy
+from copy import copy, deepcopy
 from enum import Enum, auto
 from datetime import timedelta
 from typing import Any, Dict, Literal, NewType, TYPE_CHECKING
@@ -295,10 +295,13 @@ class GQLPersistedQuery(JsonType):
             self.__setitem__("variables", variables)
 
     def with_variables(self, variables: JsonType) -> GQLPersistedQuery:
-        modified = deepcopy(self)
+        # NOTE: only the variables are ever modified, so there's no need
+        # to deep copy the rest of the operation
+        modified = copy(self)
         if "variables" in self:
-            existing_variables: JsonType = modified["variables"]
+            existing_variables: JsonType = deepcopy(self["variables"])
             _merge_vars(existing_variables, variables)
+            modified["variables"] = existing_variables
         else:
             modified["variables"] = variables
         return modified
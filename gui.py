@@ -823,14 +823,23 @@ class ConsoleOutput:
         self._text.grid(column=0, row=0, sticky="nsew")
         xscroll.grid(column=0, row=1, sticky="ew")
         yscroll.grid(column=1, row=0, sticky="ns")
+        self._pending: list[str] = []
 
     def print(self, message: str):
         stamp = datetime.now().strftime("%X")
         if '\n' in message:
             message = message.replace('\n', f"\n{stamp}: ")
+        if not self._pending:
+            # NOTE: coalesce all lines printed until the GUI is idle into a single widget update
+            self._text.after_idle(self._flush)
+        self._pending.append(f"{stamp}: {message}\n")
+
+    def _flush(self) -> None:
+        lines: str = ''.join(self._pending)
+        self._pending.clear()
         self._text.config(state="normal")
-        self._text.insert("end", f"{stamp}: {message}\n")
-        self._text.see("end")  # scroll to the newly added line
+        self._text.insert("end", lines)
+        self._text.see("end")  # scroll to the newly added lines
         self._text.config(state="disabled")
 
     def configure_theme(self, *, bg: str, fg: str, sel_bg: str, sel_fg: str):
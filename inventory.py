@@ -435,11 +435,11 @@ class DropsCampaign:
 
     @property
     def first_drop(self) -> TimedDrop | None:
-        drops: list[TimedDrop] = sorted(
+        return min(
             (drop for drop in self.drops if drop.can_earn()),
             key=lambda d: d.remaining_minutes,
+            default=None,
         )
-        return drops[0] if drops else None
 
     def _update_real_minutes(self, delta: int) -> None:
         for drop in self.drops:
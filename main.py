@@ -160,6 +160,9 @@ if __name__ == "__main__":
         exit_status = 0
         client = Twitch(settings)
         loop = asyncio.get_running_loop()
+        if sys.version_info >= (3, 12):
+            # run new tasks eagerly, until their first suspension point
+            loop.set_task_factory(asyncio.eager_task_factory)
         if sys.platform == "linux":
             loop.add_signal_handler(signal.SIGINT, lambda *_: client.gui.close())
             loop.add_signal_handler(signal.SIGTERM, lambda *_: client.gui.close())
@@ -203,6 +206,15 @@ if __name__ == "__main__":
             # already running - exit
             sys.exit(3)
 
-        asyncio.run(main())
+        if sys.platform != "win32":
+            # use the libuv-based event loop if it's available, Windows stays on Proactor
+            try:
+                import uvloop
+            except ImportError:
+                asyncio.run(main())
+            else:
+                uvloop.run(main())
+        else:
+            asyncio.run(main())
     finally:
         file.close()
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import json
+import heapq
 import asyncio
 import logging
-from time import time
 from copy import deepcopy
 from itertools import chain
 from functools import partial
-from collections import abc, deque, OrderedDict
+from operator import attrgetter
+from collections import abc, deque
 from datetime import datetime, timedelta, timezone
 from contextlib import suppress, asynccontextmanager
 from typing import Any, Literal, Final, NoReturn, overload, cast, TYPE_CHECKING
 
 import aiohttp
+import orjson
 from yarl import URL
 
 from translate import _
@@ -34,6 +36,8 @@ from utils import (
     CHARS_HEX_LOWER,
     chunk,
     timestamp,
+    json_minify,
+    retry_after,
     create_nonce,
     task_wrapper,
     RateLimiter,
@@ -75,6 +79,8 @@ class SkipExtraJsonDecoder(json.JSONDecoder):
 
 
 SAFE_LOADS = lambda s: json.loads(s, cls=SkipExtraJsonDecoder)
+# campaign statuses that are currently not expired
+APPLICABLE_STATUSES: Final[frozenset[str]] = frozenset(("ACTIVE", "UPCOMING"))
 
 
 class _AuthState:
@@ -151,7 +157,7 @@ class _AuthState:
                     #     "user_code": "8 chars [A-Z]",
                     #     "verification_uri": "https://www.twitch.tv/activate?device-code=ABCDEFGH"
                     # }
-                    response_json: JsonType = await response.json()
+                    response_json: JsonType = await response.json(loads=orjson.loads)
                     device_code: str = response_json["device_code"]
                     user_code: str = response_json["user_code"]
                     interval: int = response_json["interval"]
@@ -179,14 +185,14 @@ class _AuthState:
                         # 200 means success, 400 means the user haven't entered the code yet
                         if response.status != 200:
                             continue
-                        response_json = await response.json()
+                        response_json = await response.json(loads=orjson.loads)
                         # {
                         #     "access_token": "40 chars [A-Za-z0-9]",
                         #     "refresh_token": "40 chars [A-Za-z0-9]",
                         #     "scope": [...],
                         #     "token_type": "bearer"
                         # }
-                        self.access_token = cast(str, response_json["access_token"])
+                        self.access_token = response_json["access_token"]
                         return self.access_token
             except RequestInvalid:
                 # the device_code has expired, request a new code
@@ -318,7 +324,7 @@ class _AuthState:
                     raise LoginException(ext_msg)
             # Success handling
             if "access_token" in login_response:
-                self.access_token = cast(str, login_response["access_token"])
+                self.access_token = login_response["access_token"]
                 logger.info("Access token granted")
                 login_form.clear()
                 break
@@ -406,7 +412,7 @@ class _AuthState:
                             jar.clear_domain(client_info.CLIENT_URL.host)
                             continue
                         elif response.status == 200:
-                            validate_response = await response.json()
+                            validate_response = await response.json(loads=orjson.loads)
                             break
                 else:
                     raise RuntimeError("Login verification failure (step #2)")
@@ -423,9 +429,15 @@ class _AuthState:
             cookie["persistent"] = str(self.user_id)
             logger.info(f"Login successful, user ID: {self.user_id}")
             login_form.update(_("gui", "login", "logged_in"), self.user_id)
-            # update our cookie and save it
-            jar.update_cookies(cookie, client_info.CLIENT_URL)
-            jar.save(COOKIES_PATH)
+            # update our cookie and save it, but only if it has actually changed
+            # NOTE: pickling the cookies file happens in a thread, to not block the event loop
+            stored_cookie = jar.filter_cookies(client_info.CLIENT_URL)
+            if any(
+                key not in stored_cookie or stored_cookie[key].value != cookie[key].value
+                for key in ("auth-token", "persistent")
+            ):
+                jar.update_cookies(cookie, client_info.CLIENT_URL)
+                await asyncio.to_thread(jar.save, COOKIES_PATH)
         self._twitch.gui.help._invalidate_button.config(state="normal")
         self._logged_in.set()
 
@@ -440,6 +452,10 @@ class Twitch:
         self.inventory: list[DropsCampaign] = []
         self._drops: dict[str, TimedDrop] = {}
         self._campaigns: dict[str, DropsCampaign] = {}
+        # inventory campaigns, grouped by their game,
+        # except for the special games ones, that can be earned on any channel
+        self._game_campaigns: dict[Game, list[DropsCampaign]] = {}
+        self._special_campaigns: list[DropsCampaign] = []
         self._mnt_triggers: deque[datetime] = deque()
         # NOTE: GQL is pretty volatile and breaks everything if one runs into their rate limit.
         # Do not modify the default, safe values.
@@ -451,12 +467,19 @@ class Twitch:
         # GUI
         self.gui = GUIManager(self)
         # Storing and watching channels
-        self.channels: OrderedDict[int, Channel] = OrderedDict()
+        self.channels: dict[int, Channel] = {}
         self.watching_channel: AwaitableValue[Channel] = AwaitableValue()
         self._watching_task: asyncio.Task[None] | None = None
         self._watching_restart = asyncio.Event()
         # Websocket
         self.websocket = WebsocketPool(self)
+        # stream state message handlers, keyed by the message type
+        self._stream_state_handlers: dict[str, abc.Callable[[Channel, JsonType], None]] = {
+            "viewcount": self._on_stream_viewcount,
+            "stream-down": self._on_stream_down,
+            "stream-up": self._on_stream_up,
+            "commercial": self._on_stream_commercial,
+        }
         # Maintenance task
         self._mnt_task: asyncio.Task[None] | None = None
 
@@ -466,14 +489,18 @@ class Twitch:
                 raise RuntimeError("Session is closed")
             return session
         # load in cookies
+        # NOTE: unpickling the cookies file happens in a thread, to not block the event loop
         cookie_jar = aiohttp.CookieJar()
         try:
             if COOKIES_PATH.exists():
-                cookie_jar.load(COOKIES_PATH)
+                await asyncio.to_thread(cookie_jar.load, COOKIES_PATH)
         except Exception:
             # if loading in the cookies file ends up in an error, just ignore it
             # clear the jar, just in case
             cookie_jar.clear()
+        if self._session is not None:
+            # another call has created the session while we were loading the cookies
+            return await self.get_session()
         # create timeouts
         # connection quality mulitiplier determines the magnitude of timeouts
         connection_quality = self.settings.connection_quality
@@ -485,18 +512,24 @@ class Twitch:
             sock_connect=5*connection_quality,
             total=10*connection_quality,
         )
-        # create session, limited to 50 connections at maximum
-        connector = aiohttp.TCPConnector(limit=50)
+        # create session, limited to 50 connections at maximum, and 20 per host
+        # NOTE: Almost all requests go to the same few hosts, so cache DNS lookups for longer,
+        # and keep idle connections around long enough to be reused between GQL calls
+        connector = aiohttp.TCPConnector(
+            limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75
+        )
         self._session = aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
             cookie_jar=cookie_jar,
+            json_serialize=json_minify,
             headers={"User-Agent": self._client_type.USER_AGENT},
         )
         return self._session
 
     async def shutdown(self) -> None:
-        start_time = time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         self.stop_watching()
         if self._watching_task is not None:
             self._watching_task.cancel()
@@ -514,18 +547,22 @@ class Twitch:
             for cookie_key, cookie in list(cookie_jar._cookies.items()):
                 if not cookie:
                     del cookie_jar._cookies[cookie_key]
-            cookie_jar.save(COOKIES_PATH)
+            # close the session first, so that no request can modify the cookies anymore,
+            # then pickle them in a thread, to not block the event loop
             await self._session.close()
             self._session = None
+            await asyncio.to_thread(cookie_jar.save, COOKIES_PATH)
         self._drops.clear()
         self.channels.clear()
         self.inventory.clear()
+        self._game_campaigns.clear()
+        self._special_campaigns.clear()
         self._auth_state.clear()
         self.wanted_games.clear()
         self._mnt_triggers.clear()
         # wait at least half a second + whatever it takes to complete the closing
         # this allows aiohttp to safely close the session
-        await asyncio.sleep(start_time + 0.5 - time())
+        await asyncio.sleep(max(0.0, start_time + 0.5 - loop.time()))
 
     def wait_until_login(self) -> abc.Coroutine[Any, Any, Literal[True]]:
         return self._auth_state._logged_in.wait()
@@ -583,12 +620,6 @@ class Twitch:
             return MAX_INT
         return self.wanted_games.index(game)
 
-    @staticmethod
-    def _viewers_key(channel: Channel) -> int:
-        if (viewers := channel.viewers) is not None:
-            return viewers
-        return -1
-
     async def run(self):
         if self.settings.dump:
             with open(DUMP_PATH, 'w', encoding="utf8"):
@@ -629,7 +660,10 @@ class Twitch:
             ),
         ])
         full_cleanup: bool = False
-        channels: Final[OrderedDict[int, Channel]] = self.channels
+        # campaigns that can be progressed within the next hour, for the wanted games.
+        # Evaluated by games update, and consumed by the channels fetch right after it.
+        earnable_campaigns: list[DropsCampaign] | None = None
+        channels: Final[dict[int, Channel]] = self.channels
         self.change_state(State.INVENTORY_FETCH)
         while True:
             if self._state is State.IDLE:
@@ -646,70 +680,87 @@ class Twitch:
                 # ensure the websocket is running
                 await self.websocket.start()
                 await self.fetch_inventory()
+                earnable_campaigns = None
                 self.gui.set_games(set(campaign.game for campaign in self.inventory))
                 # Save state on every inventory fetch
                 self.save()
                 self.change_state(State.GAMES_UPDATE)
             elif self._state is State.GAMES_UPDATE:
-                # claim drops from expired and active campaigns
-                for campaign in self.inventory:
-                    if not campaign.upcoming:
-                        for drop in campaign.drops:
-                            if drop.can_claim:
-                                await drop.claim()
                 # figure out which games we want
-                self.wanted_games.clear()
-                exclude = self.settings.exclude
-                priority = self.settings.priority
+                # NOTE: Claiming drops below awaits, so build the new list locally,
+                # to not expose an empty or partial list to the rest of the miner meanwhile
+                wanted_games: list[Game] = []
+                # NOTE: settings reads go through '__getattr__', so read them only once
+                exclude: set[str] = self.settings.exclude
                 priority_mode = self.settings.priority_mode
                 priority_only = priority_mode is PriorityMode.PRIORITY_ONLY
+                # map game names to their index on the priority list,
+                # iterating in reverse so that the first occurrence wins
+                priorities: dict[str, int] = {
+                    game_name: index
+                    for index, game_name in reversed(list(enumerate(self.settings.priority)))
+                }
+                priorities_get = priorities.get
                 next_hour = datetime.now(timezone.utc) + timedelta(hours=1)
                 # sorted_campaigns: list[DropsCampaign] = list(self.inventory)
                 sorted_campaigns: list[DropsCampaign] = self.inventory
                 if not priority_only:
                     if priority_mode is PriorityMode.ENDING_SOONEST:
-                        sorted_campaigns.sort(key=lambda c: c.ends_at)
+                        sorted_campaigns.sort(key=attrgetter("ends_at"))
                     elif priority_mode is PriorityMode.LOW_AVBL_FIRST:
-                        sorted_campaigns.sort(key=lambda c: c.availability)
-                sorted_campaigns.sort(
-                    key=lambda c: (
-                        priority.index(c.game.name) if c.game.name in priority else MAX_INT
-                    )
-                )
+                        sorted_campaigns.sort(key=attrgetter("availability"))
+                sorted_campaigns.sort(key=lambda c: priorities_get(c.game.name, MAX_INT))
+                added_games: set[Game] = set()
+                earnable_campaigns = []
                 for campaign in sorted_campaigns:
+                    # claim drops from expired and active campaigns
+                    # NOTE: this has to happen before the campaign is checked below
+                    if not campaign.upcoming:
+                        for drop in campaign.drops:
+                            if drop.can_claim:
+                                await drop.claim()
                     game: Game = campaign.game
                     if (
-                        game not in self.wanted_games  # isn't already there
-                        # and isn't excluded by list or priority mode
-                        and game.name not in exclude
-                        and (not priority_only or game.name in priority)
+                        # isn't excluded by list or priority mode
+                        game.name not in exclude
+                        and (not priority_only or game.name in priorities)
                         # and can be progressed within the next hour
                         and campaign.can_earn_within(next_hour)
                     ):
-                        # non-excluded games with no priority are placed last, below priority ones
-                        self.wanted_games.append(game)
+                        earnable_campaigns.append(campaign)
+                        if game not in added_games:  # isn't already there
+                            # non-excluded games with no priority are placed last,
+                            # below priority ones
+                            wanted_games.append(game)
+                            added_games.add(game)
+                self.wanted_games[:] = wanted_games
                 full_cleanup = True
                 self.restart_watching()
                 self.change_state(State.CHANNELS_CLEANUP)
             elif self._state is State.CHANNELS_CLEANUP:
                 self.gui.status.update(_("gui", "status", "cleanup"))
+                if not full_cleanup:
+                    # not coming from games update, the earnable campaigns may be outdated
+                    earnable_campaigns = None
                 if not self.wanted_games or full_cleanup:
                     # no games selected or we're doing full cleanup: remove everything
                     to_remove_channels: list[Channel] = list(channels.values())
+                    channels.clear()
                 else:
                     # remove all channels that:
-                    to_remove_channels = [
-                        channel
-                        for channel in channels.values()
+                    wanted_set: set[Game] = set(self.wanted_games)
+                    to_remove_channels = []
+                    for channel_id, channel in list(channels.items()):
                         if (
                             not channel.acl_based  # aren't ACL-based
                             and (
                                 channel.offline  # and are offline
                                 # or online but aren't streaming the game we want anymore
-                                or (channel.game is None or channel.game not in self.wanted_games)
+                                or (channel.game is None or channel.game not in wanted_set)
                             )
-                        )
-                    ]
+                        ):
+                            to_remove_channels.append(channels.pop(channel_id))
+                    del wanted_set
                 full_cleanup = False
                 if to_remove_channels:
                     to_remove_topics: list[str] = []
@@ -720,10 +771,8 @@ class Twitch:
                         to_remove_topics.append(
                             WebsocketTopic.as_str("Channel", "StreamUpdate", channel.id)
                         )
-                    self.websocket.remove_topics(to_remove_topics)
-                    for channel in to_remove_channels:
-                        del channels[channel.id]
                         channel.remove()
+                    self.websocket.remove_topics(to_remove_topics)
                     del to_remove_channels, to_remove_topics
                 if self.wanted_games:
                     self.change_state(State.CHANNELS_FETCH)
@@ -734,7 +783,10 @@ class Twitch:
             elif self._state is State.CHANNELS_FETCH:
                 self.gui.status.update(_("gui", "status", "gathering"))
                 # start with all current channels, clear the memory and GUI
+                # NOTE: all current channels are already subscribed to their topics,
+                # so we only need to handle the difference after we're done
                 new_channels: set[Channel] = set(channels.values())
+                subscribed_ids: set[int] = set(channels.keys())
                 channels.clear()
                 self.gui.channels.clear()
                 # gather and add ACL channels from campaigns
@@ -742,16 +794,22 @@ class Twitch:
                 # NOTE: we use another set so that we can set them online separately
                 no_acl: set[Game] = set()
                 acl_channels: set[Channel] = set()
-                next_hour = datetime.now(timezone.utc) + timedelta(hours=1)
-                for campaign in self.inventory:
-                    if (
-                        campaign.game in self.wanted_games
-                        and campaign.can_earn_within(next_hour)
-                    ):
-                        if campaign.allowed_channels:
-                            acl_channels.update(campaign.allowed_channels)
-                        else:
-                            no_acl.add(campaign.game)
+                if earnable_campaigns is None:
+                    next_hour = datetime.now(timezone.utc) + timedelta(hours=1)
+                    wanted_set = set(self.wanted_games)
+                    earnable_campaigns = [
+                        campaign
+                        for campaign in self.inventory
+                        if campaign.game in wanted_set and campaign.can_earn_within(next_hour)
+                    ]
+                    del wanted_set
+                for campaign in earnable_campaigns:
+                    if campaign.allowed_channels:
+                        acl_channels.update(campaign.allowed_channels)
+                    else:
+                        no_acl.add(campaign.game)
+                # consume the evaluated campaigns, so that they're never reused later on
+                earnable_campaigns = None
                 # remove all ACL channels that already exist from the other set
                 acl_channels.difference_update(new_channels)
                 # use the other set to set them online if possible
@@ -762,24 +820,44 @@ class Twitch:
                     # for every campaign without an ACL, for it's game,
                     # add a list of live channels with drops enabled
                     new_channels.update(await self.get_live_streams(game, drops_enabled=True))
-                # sort them descending by viewers, by priority and by game priority
-                # NOTE: Viewers sort also ensures ONLINE channels are sorted to the top
-                # NOTE: We can drop using the set now, because there's no more channels being added
-                ordered_channels: list[Channel] = sorted(
-                    new_channels, key=self._viewers_key, reverse=True
-                )
-                ordered_channels.sort(key=lambda ch: ch.acl_based, reverse=True)
-                ordered_channels.sort(key=self.get_priority)
+                # sort them by game priority, ACL-based ones first and descending by viewers,
+                # all in a single pass, using a composite key.
+                # NOTE: This inlines 'get_priority', to avoid scanning the wanted games list
+                # for every channel.
+                games_priority: dict[Game, int] = {
+                    game: index for index, game in enumerate(self.wanted_games)
+                }
+                games_priority_get = games_priority.get
+
+                def channel_key(channel: Channel) -> tuple[int, bool, int]:
+                    game = channel.game
+                    viewers = channel.viewers
+                    return (
+                        MAX_INT if game is None else games_priority_get(game, MAX_INT),
+                        not channel.acl_based,
+                        # NOTE: Viewers sort also ensures ONLINE channels are sorted to the top
+                        1 if viewers is None else -viewers,
+                    )
+
                 # ensure that we won't end up with more channels than we can handle
                 # NOTE: we trim from the end because that's where the non-priority,
                 # offline (or online but low viewers) channels end up
-                to_remove_channels = ordered_channels[MAX_CHANNELS:]
-                ordered_channels = ordered_channels[:MAX_CHANNELS]
+                # NOTE: We can drop using the set now, because there's no more channels being added
+                ordered_channels: list[Channel]
+                if len(new_channels) > MAX_CHANNELS:
+                    # only the top channels are kept, so avoid sorting the whole tail
+                    ordered_channels = heapq.nsmallest(MAX_CHANNELS, new_channels, key=channel_key)
+                    to_remove_channels = list(new_channels.difference(ordered_channels))
+                else:
+                    ordered_channels = sorted(new_channels, key=channel_key)
+                    to_remove_channels = []
                 if to_remove_channels:
                     # tracked channels and gui were cleared earlier, so no need to do it here
-                    # just make sure to unsubscribe from their topics
+                    # just make sure to unsubscribe from their topics, if there were any
                     to_remove_topics = []
                     for channel in to_remove_channels:
+                        if channel.id not in subscribed_ids:
+                            continue
                         to_remove_topics.append(
                             WebsocketTopic.as_str("Channel", "StreamState", channel.id)
                         )
@@ -792,9 +870,11 @@ class Twitch:
                 for channel in ordered_channels:
                     channels[channel.id] = channel
                     channel.display(add=True)
-                # subscribe to these channel's state updates
+                # subscribe to the new channel's state updates
                 to_add_topics: list[WebsocketTopic] = []
                 for channel_id in channels:
+                    if channel_id in subscribed_ids:
+                        continue
                     to_add_topics.append(
                         WebsocketTopic(
                             "Channel", "StreamState", channel_id, self.process_stream_state
@@ -834,6 +914,8 @@ class Twitch:
                     acl_channels,
                     new_channels,
                     to_add_topics,
+                    subscribed_ids,
+                    games_priority,
                     ordered_channels,
                     watching_channel,
                 )
@@ -893,6 +975,7 @@ class Twitch:
 
     @task_wrapper(critical=True)
     async def _watch_loop(self) -> NoReturn:
+        loop = asyncio.get_running_loop()
         interval: float = WATCH_INTERVAL.total_seconds()
         while True:
             channel: Channel = await self.watching_channel.get()
@@ -902,7 +985,7 @@ class Twitch:
                 continue
             # logger.log(CALL, f"Sending watch payload to: {channel.name}")
             succeeded: bool = await channel.send_watch()
-            last_sent: float = time()
+            last_sent: float = loop.time()
             if not succeeded:
                 logger.log(CALL, f"Watch requested failed for channel: {channel.name}")
             # wait ~20 seconds for a progress update
@@ -955,7 +1038,7 @@ class Twitch:
                         handled = True
                     else:
                         logger.log(CALL, "No active drop could be determined")
-            await self._watch_sleep(interval - min(time() - last_sent, interval))
+            await self._watch_sleep(interval - min(loop.time() - last_sent, interval))
 
     @task_wrapper(critical=True)
     async def _maintenance_task(self) -> None:
@@ -989,6 +1072,17 @@ class Twitch:
         logger.log(CALL, "Maintenance task requests a reload")
         self.change_state(State.INVENTORY_FETCH)
 
+    def _channel_campaigns(self, channel: Channel) -> abc.Iterable[DropsCampaign]:
+        """
+        Returns the campaigns that could potentially be earned on the given channel.
+
+        These are the campaigns for the game the channel is streaming,
+        plus all of the special games campaigns.
+        """
+        if (game := channel.game) is None or game.is_special():
+            return self._special_campaigns
+        return chain(self._game_campaigns.get(game, ()), self._special_campaigns)
+
     def can_watch(self, channel: Channel) -> bool:
         """
         Determines if the given channel qualifies as a watching candidate.
@@ -996,7 +1090,7 @@ class Twitch:
         # exit early if stream is offline
         if not channel.online:
             return False
-        for campaign in self.inventory:
+        for campaign in self._channel_campaigns(channel):
             if (
                 campaign.can_earn(channel)  # let the campaign do the "special games" check
                 and (
@@ -1055,24 +1149,31 @@ class Twitch:
         if channel is None:
             logger.error(f"Stream state change for a non-existing channel: {channel_id}")
             return
-        if msg_type == "viewcount":
-            if not channel.online:
-                # if it's not online for some reason, set it so
-                channel.check_online()
-            else:
-                viewers = message["viewers"]
-                channel.viewers = viewers
-                channel.display()
-                # logger.debug(f"{channel.name} viewers: {viewers}")
-        elif msg_type == "stream-down":
-            channel.set_offline()
-        elif msg_type == "stream-up":
+        handler = self._stream_state_handlers.get(msg_type)
+        if handler is None:
+            logger.warning(f"Unknown stream state: {msg_type}")
+            return
+        handler(channel, message)
+
+    def _on_stream_viewcount(self, channel: Channel, message: JsonType):
+        if not channel.online:
+            # if it's not online for some reason, set it so
             channel.check_online()
-        elif msg_type == "commercial":
-            # skip these
-            pass
         else:
-            logger.warning(f"Unknown stream state: {msg_type}")
+            viewers = message["viewers"]
+            channel.viewers = viewers
+            channel.display()
+            # logger.debug(f"{channel.name} viewers: {viewers}")
+
+    def _on_stream_down(self, channel: Channel, message: JsonType):
+        channel.set_offline()
+
+    def _on_stream_up(self, channel: Channel, message: JsonType):
+        channel.check_online()
+
+    def _on_stream_commercial(self, channel: Channel, message: JsonType):
+        # skip these
+        pass
 
     @task_wrapper
     async def process_stream_update(self, channel_id: int, message: JsonType):
@@ -1166,17 +1267,18 @@ class Twitch:
         msg_type: str = message["type"]
         if msg_type not in ("drop-progress", "drop-claim"):
             return
-        drop_id: str = message["data"]["drop_id"]
+        data: JsonType = message["data"]
+        drop_id: str = data["drop_id"]
         drop: TimedDrop | None = self._drops.get(drop_id)
         watching_channel: Channel | None = self.watching_channel.get_with_default(None)
         if msg_type == "drop-claim":
             if drop is None:
                 logger.error(
                     f"Received a drop claim ID for a non-existing drop: {drop_id}\n"
-                    f"Drop claim ID: {message['data']['drop_instance_id']}"
+                    f"Drop claim ID: {data['drop_instance_id']}"
                 )
                 return
-            drop.update_claim(message["data"]["drop_instance_id"])
+            drop.update_claim(data["drop_instance_id"])
             campaign = drop.campaign
             await drop.claim()
             drop.display()
@@ -1185,12 +1287,12 @@ class Twitch:
             # via GQL, and then comparing drop IDs.
             await asyncio.sleep(4)
             if watching_channel is not None:
+                # the operation doesn't change between attempts, so build it only once
+                current_drop_op: GQLOperation = GQL_QUERIES["CurrentDrop"].with_variables(
+                    {"channelID": str(watching_channel.id)}
+                )
                 for attempt in range(8):
-                    context = await self.gql_request(
-                        GQL_QUERIES["CurrentDrop"].with_variables(
-                            {"channelID": str(watching_channel.id)}
-                        )
-                    )
+                    context = await self.gql_request(current_drop_op)
                     drop_data: JsonType | None = (
                         context["data"]["currentUser"]["dropCurrentSession"]
                     )
@@ -1206,15 +1308,15 @@ class Twitch:
         if drop is not None:
             drop_text = (
                 f"{drop.name} ({drop.campaign.game}, "
-                f"{message['data']['current_progress_min']}/"
-                f"{message['data']['required_progress_min']})"
+                f"{data['current_progress_min']}/"
+                f"{data['required_progress_min']})"
             )
         else:
             drop_text = "<Unknown>"
         logger.log(CALL, f"Drop update from websocket: {drop_text}")
-        if drop is not None and drop.can_earn(self.watching_channel.get_with_default(None)):
+        if drop is not None and drop.can_earn(watching_channel):
             # the received payload is for the drop we expected
-            drop.update_minutes(message["data"]["current_progress_min"])
+            drop.update_minutes(data["current_progress_min"])
 
     @task_wrapper
     async def process_notifications(self, user_id: int, message: JsonType):
@@ -1244,9 +1346,14 @@ class Twitch:
         method = method.upper()
         if self.settings.proxy and "proxy" not in kwargs:
             kwargs["proxy"] = self.settings.proxy
-        logger.debug(f"Request: ({method=}, {url=}, {kwargs=})")
+        # NOTE: avoid formatting potentially large payloads, unless we're actually logging them
+        debug_enabled: bool = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Request: ({method=}, {url=}, {kwargs=})")
         session_timeout = timedelta(seconds=session.timeout.total or 0)
-        backoff = ExponentialBackoff(maximum=3*60)
+        # NOTE: Use an upward-only jitter of up to 50%, so that multiple requests failing
+        # at the same time don't end up retrying in lockstep
+        backoff = ExponentialBackoff(variance=(1, 1.5), maximum=3*60)
         for delay in backoff:
             if self.gui.close_requested:
                 raise ExitRequest()
@@ -1261,14 +1368,23 @@ class Twitch:
                 response = await self.gui.coro_unless_closed(
                     session.request(method, url, **kwargs)
                 )
-                assert response is not None
-                logger.debug(f"Response: {response.status}: {response}")
-                if response.status < 500:
+                if debug_enabled:
+                    logger.debug(f"Response: {response.status}: {response}")
+                if response.status < 500 and response.status != 429:
                     # pre-read the response to avoid getting errors outside of the context manager
                     raw_response = await response.read()  # noqa
                     yield response
                     return
-                self.print(_("error", "site_down").format(seconds=round(delay)))
+                elif response.status == 429:
+                    # we're being rate limited, retry after a while,
+                    # waiting for at least as long as the server has asked us to
+                    if (
+                        server_delay := retry_after(response.headers.get("Retry-After"))
+                    ) is not None:
+                        delay = min(max(delay, server_delay), backoff.maximum)
+                    logger.warning(f"Rate limited, retrying in {round(delay)}s: {url}")
+                else:
+                    self.print(_("error", "site_down").format(seconds=round(delay)))
             except aiohttp.ClientConnectorCertificateError:
                 # for a case where SSL verification fails
                 raise
@@ -1298,7 +1414,9 @@ class Twitch:
     async def gql_request(
         self, ops: GQLOperation | list[GQLOperation]
     ) -> JsonType | list[JsonType]:
-        gql_logger.debug(f"GQL Request: {ops}")
+        debug_enabled: bool = gql_logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            gql_logger.debug(f"GQL Request: {ops}")
         backoff = ExponentialBackoff(maximum=60)
         # Use a flag to retry the request a single time, if a specific set of errors is encountered
         single_retry: bool = True
@@ -1311,8 +1429,11 @@ class Twitch:
                     json=ops,
                     headers=auth_state.headers(user_agent=self._client_type.USER_AGENT, gql=True),
                 ) as response:
-                    response_json: JsonType | list[JsonType] = await response.json()
-            gql_logger.debug(f"GQL Response: {response_json}")
+                    response_json: JsonType | list[JsonType] = await response.json(
+                        loads=orjson.loads
+                    )
+            if debug_enabled:
+                gql_logger.debug(f"GQL Response: {response_json}")
             orig_response = response_json
             if isinstance(response_json, list):
                 response_list = response_json
@@ -1397,10 +1518,11 @@ class Twitch:
     ) -> dict[str, JsonType]:
         campaign_ids: dict[str, JsonType] = dict(campaigns_chunk)
         auth_state = await self.get_auth()
+        channel_login: str = str(auth_state.user_id)
         response_list: list[JsonType] = await self.gql_request(
             [
                 GQL_QUERIES["CampaignDetails"].with_variables(
-                    {"channelLogin": str(auth_state.user_id), "dropID": cid}
+                    {"channelLogin": channel_login, "dropID": cid}
                 )
                 for cid in campaign_ids
             ]
@@ -1414,23 +1536,25 @@ class Twitch:
     async def fetch_inventory(self) -> None:
         status_update = self.gui.status.update
         status_update(_("gui", "status", "fetching_inventory"))
-        # fetch in-progress campaigns (inventory)
-        response = await self.gql_request(GQL_QUERIES["Inventory"])
-        inventory: JsonType = response["data"]["currentUser"]["inventory"]
+        # fetch in-progress campaigns (inventory) and general available campaigns data (campaigns),
+        # batched together into a single request
+        inventory_response, campaigns_response = await self.gql_request(
+            [GQL_QUERIES["Inventory"], GQL_QUERIES["Campaigns"]]
+        )
+        inventory: JsonType = inventory_response["data"]["currentUser"]["inventory"]
         ongoing_campaigns: list[JsonType] = inventory["dropCampaignsInProgress"] or []
         # this contains claimed benefit edge IDs, not drop IDs
         claimed_benefits: dict[str, datetime] = {
             b["id"]: timestamp(b["lastAwardedAt"]) for b in inventory["gameEventDrops"]
         }
         inventory_data: dict[str, JsonType] = {c["id"]: c for c in ongoing_campaigns}
-        # fetch general available campaigns data (campaigns)
-        response = await self.gql_request(GQL_QUERIES["Campaigns"])
-        available_list: list[JsonType] = response["data"]["currentUser"]["dropCampaigns"] or []
-        applicable_statuses = ("ACTIVE", "UPCOMING")
+        available_list: list[JsonType] = (
+            campaigns_response["data"]["currentUser"]["dropCampaigns"] or []
+        )
         available_campaigns: dict[str, JsonType] = {
             c["id"]: c
             for c in available_list
-            if c["status"] in applicable_statuses  # that are currently not expired
+            if c["status"] in APPLICABLE_STATUSES  # that are currently not expired
         }
         # fetch detailed data for each campaign, in chunks
         status_update(_("gui", "status", "fetching_campaigns"))
@@ -1482,23 +1606,29 @@ class Twitch:
             DropsCampaign(self, campaign_data, claimed_benefits)
             for campaign_data in inventory_data.values()
         ]
-        campaigns.sort(key=lambda c: c.active, reverse=True)
-        campaigns.sort(key=lambda c: c.upcoming and c.starts_at or c.ends_at)
-        campaigns.sort(key=lambda c: c.eligible, reverse=True)
+        # eligible first, then by the start (upcoming) or end (active) time, then active first
+        campaigns.sort(
+            key=lambda c: (not c.eligible, c.upcoming and c.starts_at or c.ends_at, not c.active)
+        )
 
-        self._drops.clear()
+        self._drops = {drop.id: drop for campaign in campaigns for drop in campaign.drops}
         self.gui.inv.clear()
         self.inventory.clear()
+        self._game_campaigns.clear()
+        self._special_campaigns.clear()
         self._mnt_triggers.clear()
         switch_triggers: set[datetime] = set()
         next_hour = datetime.now(timezone.utc) + timedelta(hours=1)
         # add the campaigns to the internal inventory
         for campaign in campaigns:
-            self._drops.update({drop.id: drop for drop in campaign.drops})
             if campaign.can_earn_within(next_hour):
                 switch_triggers.update(campaign.time_triggers)
             self.inventory.append(campaign)
             self._campaigns[campaign.id] = campaign
+            if campaign.game.is_special():
+                self._special_campaigns.append(campaign)
+            else:
+                self._game_campaigns.setdefault(campaign.game, []).append(campaign)
         # concurrently add the campaigns into the GUI
         # NOTE: this fetches pictures from the CDN, so might be slow without a cache
         status_update(
@@ -1541,14 +1671,15 @@ class Twitch:
         if watching_channel is None:
             # if we aren't watching anything, we can't earn any drops
             return None
-        campaigns: list[DropsCampaign] = []
-        for campaign in self.inventory:
-            if campaign.can_earn(watching_channel):
-                campaigns.append(campaign)
-        if campaigns:
-            campaigns.sort(key=lambda c: c.remaining_minutes)
-            return campaigns[0]
-        return None
+        return min(
+            (
+                campaign
+                for campaign in self._channel_campaigns(watching_channel)
+                if campaign.can_earn(watching_channel)
+            ),
+            key=lambda c: c.remaining_minutes,
+            default=None,
+        )
 
     async def get_live_streams(
         self, game: Game, *, limit: int = 20, drops_enabled: bool = True
@@ -18,9 +18,11 @@ from functools import wraps
 from contextlib import suppress
 from functools import cached_property
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from collections import abc, OrderedDict
 from typing import Any, Literal, Callable, Generic, Mapping, TypeVar, ParamSpec, cast
 
+import orjson
 from yarl import URL
 from PIL.ImageTk import PhotoImage
 from PIL import Image as Image_module
@@ -97,7 +99,7 @@ def json_minify(data: JsonType | list[JsonType]) -> str:
     """
     Returns minified JSON for payload usage.
     """
-    return json.dumps(data, separators=(',', ':'))
+    return orjson.dumps(data).decode("utf8")
 
 
 def timestamp(string: str) -> datetime:
@@ -107,6 +109,26 @@ def timestamp(string: str) -> datetime:
         return datetime.strptime(string, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
 
 
+def retry_after(value: str | None) -> float | None:
+    """
+    Parses the value of a Retry-After header, into the number of seconds to wait.
+
+    Returns None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # assume naive dates are UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def isonow() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", 'Z')
 
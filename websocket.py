@@ -251,7 +251,8 @@ class Websocket:
                 raw_message: aiohttp.WSMessage = await ws.receive(timeout=timeout)
             except aiohttp.ClientConnectionError:
                 raise WebsocketClosed(received=False)
-            ws_logger.debug(f"Websocket[{self._idx}] received: {raw_message}")
+            if ws_logger.isEnabledFor(logging.DEBUG):
+                ws_logger.debug(f"Websocket[{self._idx}] received: {raw_message}")
             if raw_message.type is WSMsgType.TEXT:
                 message: JsonType = json.loads(raw_message.data)
                 messages.append(message)
@@ -330,7 +331,8 @@ class Websocket:
             await ws.send_json(message, dumps=json_minify)
         except aiohttp.ClientConnectionError:
             raise WebsocketClosed(received=False)
-        ws_logger.debug(f"Websocket[{self._idx}] sent: {message}")
+        if ws_logger.isEnabledFor(logging.DEBUG):
+            ws_logger.debug(f"Websocket[{self._idx}] sent: {message}")
 
 
 class WebsocketPool: